@@ -1,353 +1,635 @@
-import os
-
-def matches_keywords(line, keywords):
-    """
-    Returns True if 'line' contains at least one of the provided keywords.
-    If 'keywords' is empty, returns True (no filtering).
-    """
-    if not keywords:
-        return True
-    lower_line = line.lower()
-    return any(kw.lower() in lower_line for kw in keywords)
-
-def get_last_line_of_file(file_path):
-    """
-    Safely reads the last non-empty line of 'file_path'.
-    Returns None if the file doesn't exist or all lines are blank.
-    """
-    if not os.path.isfile(file_path):
-        return None
-
-    last_line = None
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            text = line.strip()
-            if text:
-                last_line = text
-    return last_line
-
-def skip_to_domain(infile, start_domain):
-    """
-    Reads lines from 'infile' until a line.strip() matches 'start_domain'.
-    Returns True once the domain is found, False if EOF is reached without finding it.
-    When True is returned, the file handle is positioned right after the matching line.
-    """
-    if not start_domain:
-        return True  # No skipping needed
-
-    while True:
-        position = infile.tell()
-        line = infile.readline()
-        if not line:
-            # Reached end of file without finding domain
-            return False
-        if line.strip() == start_domain.strip():
-            # Found the domain; we're now just past it
-            return True
-
-def single_pass_filtering(
-    file_path, start_domain, protocol, keywords, infinity_count
-):
-    """
-    If user chooses to skip splitting (num_files=0 or blank),
-    we only do filtering + optional Infinity collection in a single pass.
-
-    - 'infinity_count' can be:
-        * An integer (e.g., 100) for partial collection.
-        * None for unlimited collection if the user chose 'i'.
-    """
-    base_name, ext = os.path.splitext(file_path)
-
-    # Set up Infinity file if requested
-    infinity_file = None
-    infinity_file_path = None
-    infinity_collected = 0
-
-    # If infinity_count is not 0, user wants Infinity
-    # If it's None, that means unlimited Infinity
-    if infinity_count is not None and infinity_count > 0:
-        infinity_file_path = f"{base_name}_infinity{ext}"
-        infinity_file = open(infinity_file_path, "w", encoding="utf-8")
-    elif infinity_count is None:
-        # infinity_count=None => unlimited Infinity
-        infinity_file_path = f"{base_name}_infinity{ext}"
-        infinity_file = open(infinity_file_path, "w", encoding="utf-8")
-
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as infile:
-        # If start_domain is provided, skip lines up to that domain
-        if start_domain:
-            print(f"Skipping lines until we find domain: {start_domain}")
-            found = skip_to_domain(infile, start_domain)
-            if not found:
-                print("Could not find the starting domain in the main file. No lines processed.")
-                if infinity_file:
-                    infinity_file.close()
-                return
-
-        # Now filter lines onward
-        lines_processed = 0
-        for line in infile:
-            if matches_keywords(line, keywords):
-                processed_line = f"{protocol}://{line.strip()}\n"
-                lines_processed += 1
-
-                # If Infinity is open, write lines until we hit the limit (or indefinitely if None)
-                if infinity_file:
-                    if infinity_count is None:
-                        # 'i' mode => no limit
-                        infinity_file.write(processed_line)
-                        infinity_collected += 1
-                    else:
-                        # integer mode
-                        if infinity_collected < infinity_count:
-                            infinity_file.write(processed_line)
-                            infinity_collected += 1
-
-    if infinity_file:
-        infinity_file.close()
-
-    print(f"\n--- Single-Pass Filtering Complete ---")
-    print(f"Total matching lines (after '{start_domain}' if provided): {lines_processed}")
-    if infinity_file_path and (infinity_collected > 0 or infinity_count is None):
-        count_str = f"(collected {infinity_collected} lines)" if infinity_count is not None else "(unlimited mode)"
-        print(f"Infinity file created: {infinity_file_path} {count_str}")
-
-def two_pass_splitting(
-    file_path, start_domain, num_files, protocol, keywords, infinity_count
-):
-    """
-    Two-pass approach for splitting:
-      1) First pass: Count matching lines (after skipping to 'start_domain') to
-         determine how many lines per file.
-      2) Second pass: Again skip to 'start_domain', then distribute lines among
-         split files. Simultaneously handle Infinity if needed.
-
-    - 'infinity_count' can be:
-        * An integer => partial Infinity
-        * None => unlimited Infinity
-        * 0 => skip Infinity
-    """
-    base_name, ext = os.path.splitext(file_path)
-
-    # --- FIRST PASS: Count matching lines after skipping ---
-    print("First pass: counting matching lines...")
-    total_matched = 0
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as infile:
-        # Skip lines up to the domain if provided
-        if start_domain:
-            print(f"Skipping lines until we find domain: {start_domain}")
-            found = skip_to_domain(infile, start_domain)
-            if not found:
-                print("Could not find the starting domain in the main file. No lines processed.")
-                return
-
-        for line in infile:
-            if matches_keywords(line, keywords):
-                total_matched += 1
-
-    if total_matched == 0:
-        print("No matching lines found. Nothing to split.")
-        return
-
-    print(f"Found {total_matched} matching lines.\n")
-
-    # Calculate distribution
-    lines_per_file = total_matched // num_files
-    remainder = total_matched % num_files
-
-    print(f"Splitting into {num_files} file(s) ...")
-    print(f"~{lines_per_file} lines in each file (+1 in {remainder} file(s) to handle remainder)\n")
-
-    # --- Prepare Infinity file if requested ---
-    infinity_file = None
-    infinity_file_path = None
-    infinity_collected = 0
-
-    if infinity_count is not None and infinity_count > 0:
-        infinity_file_path = f"{base_name}_infinity{ext}"
-        infinity_file = open(infinity_file_path, "w", encoding="utf-8")
-    elif infinity_count is None:
-        # 'i' => unlimited Infinity
-        infinity_file_path = f"{base_name}_infinity{ext}"
-        infinity_file = open(infinity_file_path, "w", encoding="utf-8")
-
-    # --- SECOND PASS: Distribute lines ---
-    current_file_index = 1
-    lines_in_current_file = 0
-    remainder_used = 0
-    if remainder > 0:
-        lines_for_this_file = lines_per_file + 1
-        remainder_used = 1
-    else:
-        lines_for_this_file = lines_per_file
-
-    out_file_path = f"{base_name}_split_{current_file_index}{ext}"
-    outfile = open(out_file_path, "w", encoding="utf-8")
-
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as infile:
-        # Skip lines up to the domain if provided
-        if start_domain:
-            found = skip_to_domain(infile, start_domain)
-            if not found:
-                print("Could not find the starting domain in the main file during second pass.")
-                outfile.close()
-                if infinity_file:
-                    infinity_file.close()
-                return
-
-        matched_count = 0
-        for line in infile:
-            if matches_keywords(line, keywords):
-                matched_count += 1
-                processed_line = f"{protocol}://{line.strip()}\n"
-
-                # Write to current split file
-                outfile.write(processed_line)
-                lines_in_current_file += 1
-
-                # Infinity logic
-                if infinity_file:
-                    if infinity_count is None:
-                        # 'i' => unlimited
-                        infinity_file.write(processed_line)
-                        infinity_collected += 1
-                    else:
-                        if infinity_collected < infinity_count:
-                            infinity_file.write(processed_line)
-                            infinity_collected += 1
-
-                # Move to next file if this one is full
-                if lines_in_current_file >= lines_for_this_file:
-                    outfile.close()
-                    current_file_index += 1
-                    if current_file_index > num_files:
-                        # We have filled all split files
-                        break
-
-                    out_file_path = f"{base_name}_split_{current_file_index}{ext}"
-                    outfile = open(out_file_path, "w", encoding="utf-8")
-
-                    lines_in_current_file = 0
-                    if remainder_used < remainder:
-                        lines_for_this_file = lines_per_file + 1
-                        remainder_used += 1
-                    else:
-                        lines_for_this_file = lines_per_file
-
-    # Close open files
-    if not outfile.closed:
-        outfile.close()
-    if infinity_file:
-        infinity_file.close()
-
-    print("--- Splitting Complete ---")
-    print(f"Total matching lines distributed: {total_matched}")
-    for i in range(1, current_file_index + 1):
-        split_file_name = f"{base_name}_split_{i}{ext}"
-        if os.path.exists(split_file_name):
-            print(f"Created: {split_file_name}")
-
-    if infinity_file_path:
-        if infinity_count is None:
-            print(f"Infinity file created: {infinity_file_path} (unlimited mode: {infinity_collected} lines)")
-        elif infinity_collected > 0:
-            print(f"Infinity file created: {infinity_file_path} (collected {infinity_collected} lines)")
-
-def main():
-    print("============================================")
-    print("       Welcome to the Enhanced Splitter     ")
-    print("============================================\n")
-
-    # 1) Prompt user for the main file path
-    file_path = input("Enter the full path of the main file containing all domains: ").strip()
-    if not os.path.isfile(file_path):
-        print("Main file not found. Exiting...")
-        return
-
-    # 2) Optionally ask user for a "previous filtered file" to skip lines
-    prev_filtered_path = input(
-        "Enter the path of your previous filtered file to continue from its last domain (leave blank to skip): "
-    ).strip()
-
-    start_domain = None
-    if prev_filtered_path:
-        # Read the last line of that file
-        start_domain = get_last_line_of_file(prev_filtered_path)
-        if start_domain:
-            print(f"Last domain found in '{prev_filtered_path}': {start_domain}")
-        else:
-            print(f"Could not read a valid last line from '{prev_filtered_path}'. Continuing without skipping.")
-            start_domain = None
-
-    # 3) Ask the user for number of split files
-    #    If user presses Enter or enters 0, we skip splitting
-    num_files_input = input(
-        "How many split files do you want to create? (Enter 0 or leave blank to skip splitting): "
-    ).strip()
-    skip_splitting = False
-    num_files = 0
-    if not num_files_input:  # user pressed Enter with no input
-        skip_splitting = True
-    else:
-        try:
-            num_files = int(num_files_input)
-            if num_files <= 0:
-                skip_splitting = True
-        except ValueError:
-            skip_splitting = True
-
-    # 4) Ask user which protocol they'd like to prepend
-    protocol_choice = input("Choose protocol to prepend [http or https]: ").strip().lower()
-    if protocol_choice not in ("http", "https"):
-        print("Invalid or no protocol choice. Defaulting to https...")
-        protocol_choice = "https"
-
-    # 5) Ask user for keywords (comma-separated). If empty, no keyword filtering
-    keywords_input = input("Enter keyword(s) to filter lines (comma-separated). Leave blank for no filtering: ").strip()
-    if keywords_input:
-        keywords = [kw.strip() for kw in keywords_input.split(",") if kw.strip()]
-    else:
-        keywords = []
-
-    # 6) Infinity scan - can be integer, 0, or 'i' for unlimited
-    infinity_input = input(
-        "Infinity Scan: How many matching lines in 'infinity' file? (Enter 0 to skip, or 'i' for unlimited): "
-    ).strip().lower()
-
-    # Interpret infinity input
-    if infinity_input == 'i':
-        # 'i' => unlimited Infinity
-        infinity_count = None
-    else:
-        # Try to parse an integer, default 0 if invalid
-        try:
-            infinity_count = int(infinity_input or "0")
-        except ValueError:
-            infinity_count = 0
-        if infinity_count < 0:
-            infinity_count = 0
-
-    # 7) Perform the work
-    if skip_splitting:
-        # Just filter + (optionally) do Infinity
-        print("\nSkipping file splitting. Proceeding with single-pass filtering...\n")
-        single_pass_filtering(
-            file_path=file_path,
-            start_domain=start_domain,
-            protocol=protocol_choice,
-            keywords=keywords,
-            infinity_count=infinity_count
-        )
-    else:
-        # Two-pass approach for splitting + Infinity
-        two_pass_splitting(
-            file_path=file_path,
-            start_domain=start_domain,
-            num_files=num_files,
-            protocol=protocol_choice,
-            keywords=keywords,
-            infinity_count=infinity_count
-        )
-
-if __name__ == "__main__":
-    main()
+import concurrent.futures
+import mmap
+import os
+import re
+import sys
+
+try:
+    import hyperscan  # optional: JIT-compiled multi-pattern DFA scanning
+except ImportError:
+    hyperscan = None
+
+# ASCII case-folding table: A-Z map to a-z, every other byte is unchanged.
+# bytes.translate() with this LUT folds a whole chunk in one tight C loop and,
+# unlike str.lower(), can't disturb non-ASCII bytes in either direction.
+_ASCII_LOWER = bytes(c | 0x20 if 0x41 <= c <= 0x5A else c for c in range(256))
+
+# os.writev accepts at most IOV_MAX buffers per call; flush in groups.
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+def _drop_page_cache(fd):
+    """
+    Tells the kernel the pages behind 'fd' won't be needed again, so a big
+    run doesn't evict data the rest of the system is using. Only call this
+    for files nothing is about to read back.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+class RawFileWriter:
+    """
+    Minimal buffered writer over a raw file descriptor.
+
+    Output lines are plain ASCII-ish bytes, so the TextIOWrapper/BufferedWriter
+    stack buys nothing here. Written pieces are queued in a list and submitted
+    to the kernel in one vectored os.writev() per ~1 MiB batch (in IOV_MAX
+    groups), so lines are never copied into an intermediate joined buffer and
+    the syscall cost is amortized over the whole batch.
+
+    'drop_cache' controls whether close() advises the kernel to evict the
+    written pages; pass False when the file is about to be read back (e.g.
+    split files that still feed the Infinity assembly).
+    """
+
+    def __init__(self, path, buffer_size=1 << 20, drop_cache=True):
+        self.name = path
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._parts = []
+        self._pending = 0
+        self._buffer_size = buffer_size
+        self._drop_cache = drop_cache
+
+    def write(self, data):
+        self._parts.append(data)
+        self._pending += len(data)
+        if self._pending >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._parts:
+            return
+        batch = self._parts
+        self._parts = []
+        self._pending = 0
+        if not hasattr(os, "writev"):
+            buf = b"".join(batch)
+            written = 0
+            while written < len(buf):
+                written += os.write(self._fd, buf[written:])
+            return
+        pos = 0
+        while pos < len(batch):
+            group = batch[pos:pos + _IOV_MAX]
+            written = os.writev(self._fd, group)
+            # Drop the parts this write fully covered; requeue a partial one.
+            for part in group:
+                if written >= len(part):
+                    written -= len(part)
+                    pos += 1
+                else:
+                    batch[pos] = part[written:]
+                    break
+
+    def close(self):
+        self.flush()
+        if self._drop_cache:
+            _drop_page_cache(self._fd)
+        os.close(self._fd)
+
+def _status(message):
+    """
+    Writes one status line to stderr in a single buffered call. Progress
+    goes to stderr so it stays separate from the interactive prompts and
+    can be silenced or redirected without touching stdout.
+    """
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+def open_input_mmap(infile):
+    """
+    Memory-maps the already-open binary file 'infile' read-only and hints the
+    kernel that access will be sequential so it runs readahead at full depth.
+    Returns None for an empty file (which cannot be mapped).
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(infile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    try:
+        mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return None
+    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+def _record_hit(pattern_id, hit_start, hit_end, flags, hits):
+    """Hyperscan match callback: collect the end offset of every hit."""
+    hits.append(hit_end)
+    return 0
+
+def _compile_hyperscan(kws):
+    """
+    Compiles the lowercased byte keywords into a caseless Hyperscan database,
+    or returns None when the optional package isn't installed. Keywords are
+    regex-escaped since Hyperscan expressions are patterns, not literals.
+    """
+    if hyperscan is None or not kws:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(kw) for kw in kws],
+        ids=list(range(len(kws))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(kws),
+    )
+    return db
+
+def _iter_chunks(mm, start, end, chunk_size):
+    """
+    Yields newline-aligned chunks of mm[start:end] of roughly 'chunk_size'
+    bytes, so callers never see a line split across two chunks.
+    """
+    pos = start
+    while pos < end:
+        hi = min(end, pos + chunk_size)
+        if hi < end:
+            nl = mm.find(b"\n", hi, end)
+            hi = end if nl == -1 else nl + 1
+        yield mm[pos:hi]
+        pos = hi
+
+def iter_matched_lines(mm, start, end, keywords, chunk_size=1 << 22):
+    """
+    Yields the lines of mm[start:end] that contain at least one of the
+    'keywords' (case-insensitive), in input order; with no keywords, every
+    line. The scan works one multi-MiB chunk at a time and only the lines
+    around actual hits are touched from Python. With the optional
+    'hyperscan' package installed, each chunk goes through a caseless
+    JIT-compiled DFA in a single scan (no lowercased copy needed); the
+    fallback lowercases the chunk once and locates each keyword with
+    bytes.find. Either way a chunk with no hits is rejected almost entirely
+    inside C instead of a Python iteration per line.
+    """
+    kws = [kw.encode("utf-8").translate(_ASCII_LOWER) for kw in keywords]
+
+    # No keywords => no filtering: every line matches, so skip the scanning
+    # machinery (and its per-chunk test) outright
+    if not kws:
+        for chunk in _iter_chunks(mm, start, end, chunk_size):
+            yield from chunk.splitlines(keepends=False)
+        return
+
+    scan_db = _compile_hyperscan(kws)
+
+    for chunk in _iter_chunks(mm, start, end, chunk_size):
+        spans = set()
+        if scan_db is not None:
+            hits = []
+            scan_db.scan(chunk, match_event_handler=_record_hit, context=hits)
+            for hit_end in hits:
+                p = hit_end - 1
+                line_start = chunk.rfind(b"\n", 0, p) + 1
+                line_end = chunk.find(b"\n", p)
+                if line_end == -1:
+                    line_end = len(chunk)
+                spans.add((line_start, line_end))
+        else:
+            lower = chunk.translate(_ASCII_LOWER)
+            for kw in kws:
+                p = lower.find(kw)
+                while p != -1:
+                    line_start = chunk.rfind(b"\n", 0, p) + 1
+                    line_end = chunk.find(b"\n", p)
+                    if line_end == -1:
+                        line_end = len(chunk)
+                    spans.add((line_start, line_end))
+                    # Jump past this line; more hits inside it add nothing
+                    p = lower.find(kw, line_end)
+        for line_start, line_end in sorted(spans):
+            yield chunk[line_start:line_end]
+
+def get_last_line_of_file(file_path):
+    """
+    Safely reads the last non-empty line of 'file_path' by seeking to the
+    end and walking backwards in 4 KiB blocks, so resuming from a multi-GB
+    filtered file costs a page of I/O instead of a full scan.
+    Returns None if the file doesn't exist or all lines are blank.
+    """
+    if not os.path.isfile(file_path):
+        return None
+
+    block = 4096
+    with open(file_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            size = min(block, pos)
+            pos -= size
+            f.seek(pos)
+            tail = f.read(size) + tail
+            lines = [ln for ln in tail.splitlines() if ln.strip()]
+            # The earliest buffered line may still be missing its beginning,
+            # so only trust the last one once an earlier line (and therefore
+            # a newline before it) is in the buffer, or the whole file is.
+            if len(lines) >= 2 or (lines and pos == 0):
+                return lines[-1].strip().decode("utf-8", "ignore")
+    return None
+
+def skip_to_domain(mm, start_domain):
+    """
+    Locates the line matching 'start_domain' in mapped file 'mm' and returns
+    the byte offset just past it (0 if no domain was given, -1 if it is not
+    in the file). Instead of a Python readline loop, the anchor is found with
+    mm.find — a single memchr-style C scan — and only candidate hits pay for
+    a whole-line comparison, mirroring the old line.strip() equality check.
+    """
+    if not start_domain:
+        return 0  # No skipping needed
+
+    needle = start_domain.strip().encode("utf-8")
+    pos = mm.find(needle)
+    while pos != -1:
+        line_start = mm.rfind(b"\n", 0, pos) + 1
+        line_end = mm.find(b"\n", pos + len(needle))
+        if line_end == -1:
+            line_end = len(mm)
+        # Accept only whole-line matches (modulo surrounding whitespace);
+        # a needle that is merely a substring of a longer domain keeps looking.
+        if mm[line_start:line_end].strip() == needle:
+            return min(line_end + 1, len(mm))
+        pos = mm.find(needle, line_end)
+    return -1
+
+def single_pass_filtering(
+    file_path, start_domain, protocol, keywords, infinity_count
+):
+    """
+    If user chooses to skip splitting (num_files=0 or blank),
+    we only do filtering + optional Infinity collection in a single pass.
+
+    - 'infinity_count' can be:
+        * An integer (e.g., 100) for partial collection.
+        * None for unlimited collection if the user chose 'i'.
+    """
+    base_name, ext = os.path.splitext(file_path)
+
+    # Set up Infinity file if requested: None means unlimited collection,
+    # a positive integer a capped one, and 0 no Infinity at all
+    infinity_file = None
+    infinity_file_path = None
+    infinity_collected = 0
+
+    if infinity_count is None or infinity_count > 0:
+        infinity_file_path = f"{base_name}_infinity{ext}"
+        infinity_file = RawFileWriter(infinity_file_path)
+
+    with open(file_path, "rb") as infile:
+        mm = open_input_mmap(infile)
+
+    lines_processed = 0
+    try:
+        start = 0
+        # If start_domain is provided, skip lines up to that domain
+        if mm is not None and start_domain:
+            _status(f"Skipping lines until we find domain: {start_domain}")
+            start = skip_to_domain(mm, start_domain)
+            if start < 0:
+                _status("Could not find the starting domain in the main file. No lines processed.")
+                if infinity_file:
+                    infinity_file.close()
+                return
+
+        # Now filter lines onward. The Infinity mode is fixed before the
+        # loop starts, so pick the matching loop body once instead of
+        # re-testing the same conditions on every matched line.
+        prefix = (protocol + "://").encode("utf-8")
+        matched = iter_matched_lines(mm, start, len(mm), keywords) if mm is not None else iter(())
+        if infinity_file is None:
+            # Nothing to write; only the match count is wanted
+            lines_processed = sum(1 for _ in matched)
+        elif infinity_count is None:
+            # 'i' mode => collect every matched line
+            for line in matched:
+                infinity_file.write(prefix + line.rstrip(b"\r\n") + b"\n")
+                lines_processed += 1
+            infinity_collected = lines_processed
+        else:
+            # integer mode => collect up to the cap, then close the file and
+            # fall through to a bare count of whatever matches remain
+            for line in matched:
+                lines_processed += 1
+                infinity_file.write(prefix + line.rstrip(b"\r\n") + b"\n")
+                infinity_collected += 1
+                if infinity_collected >= infinity_count:
+                    infinity_file.close()
+                    infinity_file = None
+                    break
+            lines_processed += sum(1 for _ in matched)
+    finally:
+        if mm is not None:
+            mm.close()
+
+    if infinity_file:
+        infinity_file.close()
+
+    _status(f"\n--- Single-Pass Filtering Complete ---")
+    _status(f"Total matching lines (after '{start_domain}' if provided): {lines_processed}")
+    if infinity_file_path and (infinity_collected > 0 or infinity_count is None):
+        count_str = f"(collected {infinity_collected} lines)" if infinity_count is not None else "(unlimited mode)"
+        _status(f"Infinity file created: {infinity_file_path} {count_str}")
+
+def _partition_ranges(mm, start, num_ranges):
+    """
+    Cuts mm[start:] into 'num_ranges' contiguous byte ranges aligned to line
+    boundaries (each range except the last ends just past a newline). Ranges
+    are balanced by bytes, so on uniform line lengths the resulting files
+    hold roughly the same number of lines. Trailing ranges may be empty for
+    tiny inputs.
+    """
+    size = len(mm)
+    span = max(1, (size - start) // num_ranges)
+    ranges = []
+    lo = start
+    for i in range(num_ranges):
+        if i == num_ranges - 1:
+            hi = size
+        else:
+            hi = min(size, lo + span)
+            nl = mm.find(b"\n", hi)
+            hi = size if nl == -1 else nl + 1
+        if hi < lo:
+            hi = lo
+        ranges.append((lo, hi))
+        lo = hi
+    return ranges
+
+def _split_worker(file_path, lo, hi, out_path, protocol, keywords, drop_cache):
+    """
+    Worker process: maps 'file_path' read-only, filters lines in [lo, hi)
+    and writes the matched ones (with the protocol prefix) to 'out_path'.
+    Returns the number of matched lines. 'drop_cache' must be False when the
+    split file is about to be read back for Infinity assembly.
+    """
+    prefix = (protocol + "://").encode("utf-8")
+    matched = 0
+    outfile = RawFileWriter(out_path, drop_cache=drop_cache)
+    try:
+        with open(file_path, "rb") as infile:
+            mm = open_input_mmap(infile)
+        if mm is None:
+            return 0
+        try:
+            for line in iter_matched_lines(mm, lo, hi, keywords):
+                outfile.write(prefix + line.rstrip(b"\r\n") + b"\n")
+                matched += 1
+        finally:
+            mm.close()
+    finally:
+        outfile.close()
+    return matched
+
+def _concat_files(dst_path, src_paths):
+    """
+    Concatenates 'src_paths' into 'dst_path' with os.sendfile, which copies
+    file-to-file inside the kernel without the bytes ever crossing into user
+    space. Falls back to a plain buffered copy where sendfile doesn't
+    support regular-file targets.
+    """
+    dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for path in src_paths:
+            with open(path, "rb") as src:
+                size = os.fstat(src.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    try:
+                        sent = os.sendfile(dst_fd, src.fileno(), offset, size - offset)
+                    except (AttributeError, OSError):
+                        src.seek(offset)
+                        while True:
+                            chunk = src.read(1 << 20)
+                            if not chunk:
+                                break
+                            written = 0
+                            while written < len(chunk):
+                                written += os.write(dst_fd, chunk[written:])
+                        break
+                    if sent == 0:
+                        break
+                    offset += sent
+        # The Infinity file itself is never read back
+        _drop_page_cache(dst_fd)
+    finally:
+        os.close(dst_fd)
+
+def _collect_infinity(infinity_file_path, split_paths, infinity_count):
+    """
+    Builds a capped Infinity file from the freshly written split files,
+    which — since the split ranges are contiguous — concatenate back into
+    input order. Returns the number of lines collected (at most
+    'infinity_count'). The unlimited case doesn't come here; it is a pure
+    concatenation handled zero-copy by _concat_files.
+    """
+    collected = 0
+    infinity_file = RawFileWriter(infinity_file_path)
+    try:
+        for path in split_paths:
+            with open(path, "rb") as src:
+                for line in src:
+                    if collected >= infinity_count:
+                        return collected
+                    infinity_file.write(line)
+                    collected += 1
+    finally:
+        infinity_file.close()
+    return collected
+
+def single_pass_splitting(
+    file_path, start_domain, num_files, protocol, keywords, infinity_count
+):
+    """
+    Splits matching lines across 'num_files' files in a single parallel pass.
+
+    The input mapping is cut into 'num_files' contiguous newline-aligned
+    byte ranges, and one worker process filters each range into its own
+    split file, so the scan scales across CPU cores instead of running on
+    one. Ranges are balanced by bytes rather than exact line counts. The
+    Infinity file is assembled afterwards from the split outputs (which
+    concatenate back into input order), not written alongside them.
+
+    - 'infinity_count' can be:
+        * An integer => partial Infinity
+        * None => unlimited Infinity
+        * 0 => skip Infinity
+    """
+    base_name, ext = os.path.splitext(file_path)
+
+    infinity_file_path = None
+    if infinity_count is None or infinity_count > 0:
+        infinity_file_path = f"{base_name}_infinity{ext}"
+
+    out_paths = [f"{base_name}_split_{i}{ext}" for i in range(1, num_files + 1)]
+
+    _status(f"Splitting into {num_files} file(s) ...")
+
+    with open(file_path, "rb") as infile:
+        mm = open_input_mmap(infile)
+
+    ranges = None
+    if mm is not None:
+        try:
+            start = 0
+            # Skip lines up to the domain if provided
+            if start_domain:
+                _status(f"Skipping lines until we find domain: {start_domain}")
+                start = skip_to_domain(mm, start_domain)
+                if start < 0:
+                    _status("Could not find the starting domain in the main file. No lines processed.")
+                    start = len(mm)
+            ranges = _partition_ranges(mm, start, num_files)
+        finally:
+            mm.close()
+
+    matched_count = 0
+    if ranges is not None:
+        # Split files feed the Infinity assembly right after the workers
+        # finish, so keep their pages cached until that read is done
+        drop_cache = infinity_file_path is None
+        workers = min(num_files, os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_split_worker, file_path, lo, hi, path, protocol, keywords, drop_cache)
+                for (lo, hi), path in zip(ranges, out_paths)
+            ]
+            matched_count = sum(f.result() for f in futures)
+
+    if matched_count == 0:
+        _status("No matching lines found. Nothing to split.")
+        # Only clean up files the workers actually created this run; with an
+        # unmappable (empty) input no worker ran, and any files matching the
+        # split names are leftovers from an earlier run
+        if ranges is not None:
+            for p in out_paths:
+                if os.path.exists(p):
+                    os.remove(p)
+        return
+
+    infinity_collected = 0
+    if infinity_file_path:
+        if infinity_count is None:
+            # Unlimited Infinity is just the split files glued back together
+            _concat_files(infinity_file_path, out_paths)
+            infinity_collected = matched_count
+        else:
+            infinity_collected = _collect_infinity(
+                infinity_file_path, out_paths, infinity_count
+            )
+        # Infinity assembly was the last reader of the split files; their
+        # pages can leave the cache now
+        for p in out_paths:
+            with open(p, "rb") as f:
+                _drop_page_cache(f.fileno())
+
+    _status("--- Splitting Complete ---")
+    _status(f"Total matching lines distributed: {matched_count}")
+    for p in out_paths:
+        if os.path.exists(p):
+            _status(f"Created: {p}")
+
+    if infinity_file_path:
+        if infinity_count is None:
+            _status(f"Infinity file created: {infinity_file_path} (unlimited mode: {infinity_collected} lines)")
+        elif infinity_collected > 0:
+            _status(f"Infinity file created: {infinity_file_path} (collected {infinity_collected} lines)")
+
+def main():
+    print("============================================")
+    print("       Welcome to the Enhanced Splitter     ")
+    print("============================================\n")
+
+    # 1) Prompt user for the main file path
+    file_path = input("Enter the full path of the main file containing all domains: ").strip()
+    if not os.path.isfile(file_path):
+        print("Main file not found. Exiting...")
+        return
+
+    # 2) Optionally ask user for a "previous filtered file" to skip lines
+    prev_filtered_path = input(
+        "Enter the path of your previous filtered file to continue from its last domain (leave blank to skip): "
+    ).strip()
+
+    start_domain = None
+    if prev_filtered_path:
+        # Read the last line of that file
+        start_domain = get_last_line_of_file(prev_filtered_path)
+        if start_domain:
+            print(f"Last domain found in '{prev_filtered_path}': {start_domain}")
+        else:
+            print(f"Could not read a valid last line from '{prev_filtered_path}'. Continuing without skipping.")
+            start_domain = None
+
+    # 3) Ask the user for number of split files
+    #    If user presses Enter or enters 0, we skip splitting
+    num_files_input = input(
+        "How many split files do you want to create? (Enter 0 or leave blank to skip splitting): "
+    ).strip()
+    skip_splitting = False
+    num_files = 0
+    if not num_files_input:  # user pressed Enter with no input
+        skip_splitting = True
+    else:
+        try:
+            num_files = int(num_files_input)
+            if num_files <= 0:
+                skip_splitting = True
+        except ValueError:
+            skip_splitting = True
+
+    # 4) Ask user which protocol they'd like to prepend
+    protocol_choice = input("Choose protocol to prepend [http or https]: ").strip().lower()
+    if protocol_choice not in ("http", "https"):
+        print("Invalid or no protocol choice. Defaulting to https...")
+        protocol_choice = "https"
+
+    # 5) Ask user for keywords (comma-separated). If empty, no keyword filtering
+    keywords_input = input("Enter keyword(s) to filter lines (comma-separated). Leave blank for no filtering: ").strip()
+    if keywords_input:
+        keywords = [kw.strip() for kw in keywords_input.split(",") if kw.strip()]
+    else:
+        keywords = []
+
+    # 6) Infinity scan - can be integer, 0, or 'i' for unlimited
+    infinity_input = input(
+        "Infinity Scan: How many matching lines in 'infinity' file? (Enter 0 to skip, or 'i' for unlimited): "
+    ).strip().lower()
+
+    # Interpret infinity input
+    if infinity_input == 'i':
+        # 'i' => unlimited Infinity
+        infinity_count = None
+    else:
+        # Try to parse an integer, default 0 if invalid
+        try:
+            infinity_count = int(infinity_input or "0")
+        except ValueError:
+            infinity_count = 0
+        if infinity_count < 0:
+            infinity_count = 0
+
+    # 7) Perform the work
+    if skip_splitting:
+        # Just filter + (optionally) do Infinity
+        print("\nSkipping file splitting. Proceeding with single-pass filtering...\n")
+        single_pass_filtering(
+            file_path=file_path,
+            start_domain=start_domain,
+            protocol=protocol_choice,
+            keywords=keywords,
+            infinity_count=infinity_count
+        )
+    else:
+        # Parallel single-pass splitting + Infinity
+        single_pass_splitting(
+            file_path=file_path,
+            start_domain=start_domain,
+            num_files=num_files,
+            protocol=protocol_choice,
+            keywords=keywords,
+            infinity_count=infinity_count
+        )
+
+if __name__ == "__main__":
+    main()